@@ -3,6 +3,7 @@ import logging
 
 from mpi4py import MPI
 
+from rdy2cpl.grids.base.orca import close_orca_grids
 from rdy2cpl.grids.couple_grid import from_model_spec, update_model_spec
 from rdy2cpl.loader import pyoasis
 from rdy2cpl.namcouple.factory import from_yaml
@@ -139,6 +140,8 @@ def main(
 
         cpl_grid_source.write()
         cpl_grid_target.write()
+        # The ORCA files are not needed anymore, release their handles
+        close_orca_grids()
 
         pyoasis.Var(f"VAR_{rank:02}_S", cpl_grid_source.partition, pyoasis.OASIS.OUT)
         pyoasis.Var(f"VAR_{rank:02}_T", cpl_grid_target.partition, pyoasis.OASIS.IN)
@@ -1,14 +1,80 @@
+import logging
+import os
+from functools import cached_property
+
 import numpy as np
 from netCDF4 import Dataset
 
-_MISSING_VALUE = 1e20
+_log = logging.getLogger(__name__)
+
+_SUBGRIDS = frozenset(("t", "u", "v"))
+_BACKENDS = frozenset(("netcdf4", "h5py"))
+
+# Files larger than this (in bytes) are not loaded into memory, even if asked
+# to, because a domain_cfg also holds 3D fields that are never read here
+_MAX_IN_MEMORY_SIZE = 1024**3
 
 
 def _check(subgrid):
-    if not subgrid in ("t", "u", "v"):
+    if subgrid not in _SUBGRIDS:
         raise ValueError(f'Invalid ORCA subgrid: "{subgrid}"')
 
 
+def _realpath(path):
+    """Returns the canonical path of a file, or None if path is None"""
+    return None if path is None else os.path.realpath(path)
+
+
+def _variables(nc):
+    """Returns the variables of an open netCDF4.Dataset or h5py.File (which is
+    itself a mapping of variable names to datasets)"""
+    return nc.variables if isinstance(nc, Dataset) else nc
+
+
+def _isopen(nc):
+    """Checks if a netCDF4.Dataset or h5py.File (which evaluates to False once
+    it is closed) is open"""
+    return nc.isopen() if isinstance(nc, Dataset) else bool(nc)
+
+
+def _as_dtype(values, dtype):
+    """Casts values to dtype (without copy, if possible). If dtype is None, the
+    values are returned unchanged"""
+    return values if dtype is None else values.astype(dtype, copy=False)
+
+
+def _corners_from_halo(halo):
+    """Assembles the (ni, nj, 4) corner array in one pass from the (ni+1, nj+1)
+    array of corner points, see OrcaGrid for the corner numbering"""
+    return np.stack(
+        (halo[1:, 1:], halo[:-1, 1:], halo[:-1, :-1], halo[1:, :-1]), axis=-1
+    )
+
+
+# Variables needed from the NEMO domain config and (optional) masks file
+_REQUIRED_VARS = frozenset(
+    (
+        "glamt",
+        "glamu",
+        "glamv",
+        "glamf",
+        "gphit",
+        "gphiu",
+        "gphiv",
+        "gphif",
+        "e1t",
+        "e1u",
+        "e1v",
+        "e1f",
+        "e2t",
+        "e2u",
+        "e2v",
+        "e2f",
+        "top_level",
+    )
+)
+_REQUIRED_MASK_VARS = frozenset(("tmaskutil", "umaskutil", "vmaskutil"))
+
 _orca_names = {
     (362, 292, 75): "ORCA1L75",
     (360, 331, 75): "eORCA1L75",
@@ -16,62 +82,159 @@ _orca_names = {
 
 
 class OrcaGrid:
-    def __init__(self, domain_cfg, masks=None):
+    # The NetCDF files are opened once and kept open until close() is
+    # called, so that the file metadata is not parsed again on every read.
+    # Class-level defaults keep close() (and __del__) safe if __init__ fails
+    # before the files are opened.
+    _nc = _nc_masks = None
+
+    def __init__(
+        self,
+        domain_cfg,
+        masks=None,
+        *,
+        chunk_cache_size=None,
+        backend="netcdf4",
+        in_memory=False,
+    ):
 
         self.domain_cfg = domain_cfg
         self.masks = masks
 
-        with Dataset(domain_cfg) as nc:
-            try:
-                ni = nc.dimensions["x"].size
-                nj = nc.dimensions["y"].size
-                nk = nc.dimensions["z"].size
-            except KeyError:
-                raise RuntimeError("Missing dimensions in NEMO domain config")
+        # Size (in bytes) of the HDF5 chunk cache set for each variable (netcdf4
+        # backend) or file (h5py backend). If None, the library default is used.
+        self.chunk_cache_size = chunk_cache_size
 
-            self.shape = (ni, nj)
-            self.size = ni * nj
+        # The files are read either with netCDF4 or, since the NEMO files are
+        # netCDF-4/HDF5 files, directly with h5py, which skips the netCDF
+        # layer. Note that h5py does not apply scale_factor/add_offset.
+        if backend not in _BACKENDS:
+            raise ValueError(f'Invalid ORCA backend: "{backend}"')
+        self.backend = backend
 
-            try:
-                self.name = _orca_names[(ni, nj, nk)]
-            except KeyError:
-                raise RuntimeError("Unknown dimensions in NEMO domain config")
-
-            if not {
-                "glamt",
-                "glamu",
-                "glamv",
-                "glamf",
-                "gphit",
-                "gphiu",
-                "gphiv",
-                "gphif",
-                "e1t",
-                "e1u",
-                "e1v",
-                "e1f",
-                "e2t",
-                "e2u",
-                "e2v",
-                "e2f",
-                "top_level",
-            }.issubset(nc.variables):
-                raise RuntimeError("Missing variables in NEMO domain config")
+        # If True, each file is read into memory once when it is opened (unless
+        # it is larger than _MAX_IN_MEMORY_SIZE) and all reads are served from
+        # there instead of from disk
+        self.in_memory = in_memory
+
+        self._nc = self._open(domain_cfg)
+
+        # Variables already read from file, keyed by variable name
+        self._vars = {}
+
+        try:
+            ni = self._dimension_size("x")
+            nj = self._dimension_size("y")
+            nk = self._dimension_size("z")
+        except KeyError:
+            raise RuntimeError("Missing dimensions in NEMO domain config")
+
+        self.shape = (ni, nj)
+        self.size = ni * nj
+
+        # Row indices for the corner halo arrays (see read_corner_*), extending
+        # the grid periodically by one row to the west or to the east, and the
+        # reversed (and periodic) row order across the northern F-pivot
+        # (int32 is plenty for ORCA grid sizes and halves the index footprint)
+        self._halo_rows_west = np.arange(-1, ni, dtype=np.int32) % ni
+        self._halo_rows_east = np.arange(ni + 1, dtype=np.int32) % ni
+        self._halo_rows_pivot = np.arange(-1, -ni - 2, -1, dtype=np.int32) % ni
+
+        try:
+            self.name = _orca_names[(ni, nj, nk)]
+        except KeyError:
+            raise RuntimeError("Unknown dimensions in NEMO domain config")
+
+        if not _REQUIRED_VARS.issubset(_variables(self._nc)):
+            raise RuntimeError("Missing variables in NEMO domain config")
 
         if self.masks is not None:
-            with Dataset(self.masks) as nc:
-                if not {"tmaskutil", "umaskutil", "vmaskutil"}.issubset(nc.variables):
-                    raise RuntimeError("Missing variables in NEMO masks file")
+            self._nc_masks = self._open(self.masks)
+            if not _REQUIRED_MASK_VARS.issubset(_variables(self._nc_masks)):
+                raise RuntimeError("Missing variables in NEMO masks file")
+
+    def _open(self, path):
+        in_memory = self.in_memory
+        if in_memory and os.path.getsize(path) > _MAX_IN_MEMORY_SIZE:
+            _log.warning(
+                f"File too large to load into memory, reading from disk: {path}"
+            )
+            in_memory = False
+
+        if self.backend == "h5py":
+            try:
+                import h5py
+            except ModuleNotFoundError:
+                raise ModuleNotFoundError(
+                    "Module 'h5py' not found, it is needed for the 'h5py' backend"
+                ) from None
+            kwargs = {"driver": "core", "backing_store": False} if in_memory else {}
+            # h5py sets the chunk cache per file, not per variable
+            if self.chunk_cache_size is not None:
+                kwargs["rdcc_nbytes"] = self.chunk_cache_size
+            return h5py.File(path, "r", **kwargs)
+
+        if in_memory:
+            with open(path, "rb") as f:
+                nc = Dataset(path, memory=f.read())
+        else:
+            nc = Dataset(path)
+        # Auto-masking is switched off, the masks are never used and building
+        # them costs a full scan for the fill value on every read
+        nc.set_auto_mask(False)
+        return nc
+
+    def _dimension_size(self, name):
+        if self.backend == "h5py":
+            # netCDF-4 stores dimensions as HDF5 datasets of the same name
+            return self._nc[name].shape[0]
+        return self._nc.dimensions[name].size
+
+    @property
+    def closed(self):
+        return self._nc is None or not _isopen(self._nc)
+
+    def close(self):
+        for nc in (self._nc, self._nc_masks):
+            if nc is not None and _isopen(nc):
+                nc.close()
+
+    def __del__(self):
+        self.close()
+
+    def _read(self, varname, nc=None):
+        """Returns the (transposed) first record of a variable. Each variable is
+        read from file only once, subsequent calls return the stored array."""
+        try:
+            return self._vars[varname]
+        except KeyError:
+            nc = self._nc if nc is None else nc
+            var = nc[varname]
+            if (
+                self.chunk_cache_size is not None
+                and self.backend == "netcdf4"
+                and nc.data_model.startswith("NETCDF4")
+            ):
+                var.set_var_chunk_cache(size=self.chunk_cache_size)
+            # Transpose once into a contiguous (ni, nj) array, instead of
+            # leaving a strided view for every consumer to gather from
+            values = self._vars[varname] = np.ascontiguousarray(var[0, ...].T)
+            # The stored arrays are shared by all grids built from the same
+            # files, make sure they can't be modified in place
+            values.flags.writeable = False
+            return values
+
+    #   The center and corner readers take an optional dtype argument, e.g.
+    #   "float32" to reduce the memory footprint of the geometry arrays. By
+    #   default, the data type of the domain_cfg variables is kept.
 
-    def read_center_latitudes(self, subgrid):
+    def read_center_latitudes(self, subgrid, dtype=None):
         _check(subgrid)
-        with Dataset(self.domain_cfg) as nc:
-            return nc.variables[f"gphi{subgrid}"][0, ...].data.T
+        return _as_dtype(self._read(f"gphi{subgrid}"), dtype)
 
-    def read_center_longitudes(self, subgrid):
+    def read_center_longitudes(self, subgrid, dtype=None):
         _check(subgrid)
-        with Dataset(self.domain_cfg) as nc:
-            return nc.variables[f"glam{subgrid}"][0, ...].data.T
+        return _as_dtype(self._read(f"glam{subgrid}"), dtype)
 
     #   For the ORCA grid and staggered subgrids, see NEMO book
     #   Section "4 Space Domain (DOM)"
@@ -83,176 +246,185 @@ class OrcaGrid:
     #       |  |         |
     #       |  2 --------3
     #       +------------> i
+    #
+    #   The corners are assembled from a (ni+1, nj+1) "halo" array, which holds
+    #   the corner points of all cells, such that cell (i, j) has the corners
+    #   halo[i:i+2, j:j+2]. Depending on the subgrid, the corner points are
+    #   extended by a periodic halo in i and an extrapolated (south) or F-pivot
+    #   (north) halo in j.
 
-    def read_corner_latitudes(self, subgrid):
+    def read_corner_latitudes(self, subgrid, dtype=None):
         _check(subgrid)
         lat_var = {
             "t": "gphif",
             "u": "gphiv",
             "v": "gphiu",
         }
-        with Dataset(self.domain_cfg) as nc:
-            lat_values = nc.variables[lat_var[subgrid]][0, ...].data.T
-        corner_lats = np.full((*self.shape, 4), _MISSING_VALUE)
-
-        if subgrid in ("t"):
-            corner_lats[:, :, 0] = lat_values
-            corner_lats[1:, :, 1] = lat_values[:-1, :]
-            corner_lats[0, :, 1] = lat_values[-1, :]
-            corner_lats[:, 1:, 3] = lat_values[:, :-1]
-            corner_lats[:, 0, 3] = 2 * lat_values[:, 1] - lat_values[:, 2]
-            corner_lats[1:, 1:, 2] = lat_values[:-1, :-1]
-            corner_lats[0, 1:, 2] = lat_values[-1, :-1]
-            corner_lats[1:, 0, 2] = 2 * lat_values[:-1, 1] - lat_values[:-1, 2]
-            corner_lats[0, 0, 2] = 2 * lat_values[-1, 1] - lat_values[-1, 2]
+        lat_values = self._read(lat_var[subgrid])
+        ni, nj = self.shape
+        halo = np.empty((ni + 1, nj + 1), dtype=lat_values.dtype)
+
+        if subgrid == "t":
+            lat_values.take(self._halo_rows_west, axis=0, mode="wrap", out=halo[:, 1:])
+            halo[:, 0] = 2 * halo[:, 2] - halo[:, 3]
         elif subgrid == "u":
-            corner_lats[:, :, 1] = lat_values
-            corner_lats[:-1, :, 0] = lat_values[1:, :]
-            corner_lats[-1, :, 0] = lat_values[0, :]
-            corner_lats[:, 1:, 2] = lat_values[:, :-1]
-            corner_lats[:, 0, 2] = 2 * lat_values[:, 1] - lat_values[:, 2]
-            corner_lats[:-1, 1:, 3] = lat_values[1:, :-1]
-            corner_lats[-1, 1:, 3] = lat_values[0, :-1]
-            corner_lats[:-1, 0, 3] = 2 * lat_values[1:, 1] - lat_values[1:, 2]
-            corner_lats[-1, 0, 3] = 2 * lat_values[0, 1] - lat_values[0, 2]
+            lat_values.take(self._halo_rows_east, axis=0, mode="wrap", out=halo[:, 1:])
+            halo[:, 0] = 2 * halo[:, 2] - halo[:, 3]
         elif subgrid == "v":
+            lat_values.take(self._halo_rows_west, axis=0, mode="wrap", out=halo[:, :-1])
             # F-pivot special treatment
-            rever_lats = lat_values[::-1, -1]
-            corner_lats[:, :-1, 0] = lat_values[:, 1:]
-            corner_lats[:-1, -1, 0] = rever_lats[1:]
-            corner_lats[-1, -1, 0] = rever_lats[0]
-            #
-            corner_lats[1:, :-1, 1] = lat_values[:-1, 1:]
-            corner_lats[0, :-1, 1] = lat_values[-1, 1:]
-            corner_lats[:, -1, 1] = rever_lats[:]
-            #
-            corner_lats[1:, :, 2] = lat_values[:-1, :]
-            corner_lats[0, :, 2] = lat_values[-1, :]
-            #
-            corner_lats[:, :, 3] = lat_values
-        return corner_lats
-
-    def read_corner_longitudes(self, subgrid):
+            lat_values[:, -1].take(self._halo_rows_pivot, mode="wrap", out=halo[:, -1])
+        return _corners_from_halo(_as_dtype(halo, dtype))
+
+    def read_corner_longitudes(self, subgrid, dtype=None):
         _check(subgrid)
         lon_var = {
             "t": "glamf",
             "u": "glamv",
             "v": "glamu",
         }
-        with Dataset(self.domain_cfg) as nc:
-            lon_values = nc.variables[lon_var[subgrid]][0, ...].data.T
-        corner_lons = np.full((*self.shape, 4), _MISSING_VALUE)
-
-        if subgrid in ("t"):
-            corner_lons[:, :, 0] = lon_values
-            corner_lons[1:, :, 1] = lon_values[:-1, :]
-            corner_lons[0, :, 1] = lon_values[-1, :]
-            corner_lons[:, 1:, 3] = lon_values[:, :-1]
-            corner_lons[:, 0, 3] = lon_values[:, 1]
-            corner_lons[1:, 1:, 2] = lon_values[:-1, :-1]
-            corner_lons[0, 1:, 2] = lon_values[-1, :-1]
-            corner_lons[1:, 0, 2] = lon_values[:-1, 1]
-            corner_lons[0, 0, 2] = lon_values[-1, 1]
+        lon_values = self._read(lon_var[subgrid])
+        ni, nj = self.shape
+        halo = np.empty((ni + 1, nj + 1), dtype=lon_values.dtype)
+
+        if subgrid == "t":
+            lon_values.take(self._halo_rows_west, axis=0, mode="wrap", out=halo[:, 1:])
+            halo[:, 0] = halo[:, 2]
         elif subgrid == "u":
-            corner_lons[:, :, 1] = lon_values
-            corner_lons[:-1, :, 0] = lon_values[1:, :]
-            corner_lons[-1, :, 0] = lon_values[0, :]
-            corner_lons[:, 1:, 2] = lon_values[:, :-1]
-            corner_lons[:, 0, 2] = lon_values[:, 1]
-            corner_lons[:-1, 1:, 3] = lon_values[1:, :-1]
-            corner_lons[-1, 1:, 3] = lon_values[0, :-1]
-            corner_lons[:, 0, 3] = corner_lons[:, 1, 3]
+            lon_values.take(self._halo_rows_east, axis=0, mode="wrap", out=halo[:, 1:])
+            halo[:, 0] = halo[:, 2]
         elif subgrid == "v":
+            lon_values.take(self._halo_rows_west, axis=0, mode="wrap", out=halo[:, :-1])
             # F-pivot special treatment
-            rever_lons = lon_values[::-1, -1]
-            corner_lons[:, :-1, 0] = lon_values[:, 1:]
-            corner_lons[:-1, -1, 0] = rever_lons[1:]
-            corner_lons[-1, -1, 0] = rever_lons[0]
-            #
-            corner_lons[1:, :-1, 1] = lon_values[:-1, 1:]
-            corner_lons[0, :-1, 1] = lon_values[-1, 1:]
-            corner_lons[:, -1, 1] = rever_lons[:]
-            #
-            corner_lons[1:, :, 2] = lon_values[:-1, :]
-            corner_lons[0, :, 2] = lon_values[-1, :]
-            #
-            corner_lons[:, :, 3] = lon_values
+            lon_values[:, -1].take(self._halo_rows_pivot, mode="wrap", out=halo[:, -1])
+        corner_lons = _corners_from_halo(_as_dtype(halo, dtype))
+
+        if subgrid == "u":
+            corner_lons[:, 0, 3] = corner_lons[:, 1, 3]
         return corner_lons
 
     def read_areas(self, subgrid):
         _check(subgrid)
-        with Dataset(self.domain_cfg) as nc:
-            return (
-                nc.variables[f"e1{subgrid}"][0, ...].data.T
-                * nc.variables[f"e2{subgrid}"][0, ...].data.T
-            )
+        return self._read(f"e1{subgrid}") * self._read(f"e2{subgrid}")
+
+    @cached_property
+    def _tmask(self):
+        """T mask computed from top_level in domain_cfg, see Section "4.3.6 level
+        bathymetry and mask" in the NEMO book. Computed once and shared by the
+        T, U, and V masks (and hence read-only)."""
+        tmask = (self._read("top_level") == 0).astype(np.uint8)
+        tmask.flags.writeable = False
+        return tmask
 
     def read_mask(self, subgrid):
         _check(subgrid)
 
+        # Masks are returned as uint8 arrays (1: masked, 0: not masked)
+
         # If a NEMO mask file is provided, just read T, U, V masks
         if self.masks:
-            with Dataset(self.masks) as nc:
-                mask = np.where(
-                    nc.variables[f"{subgrid}maskutil"][0, ...].data.T > 0, 0, 1
-                )
-                return mask
-
-        # Without a NEMO mask file, compute masks from top_level in domain_cfg
-        # See Section "4.3.6 level bathymetry and mask" in the NEMO book
-        with Dataset(self.domain_cfg) as nc:
-            tmask = np.where(nc.variables["top_level"][0, ...].data.T == 0, 1, 0)
-            if subgrid == "t":
-                return tmask
-            elif subgrid == "u":
-                umask = tmask * tmask.take(
-                    range(1, tmask.shape[0] + 1), axis=0, mode="wrap"
-                )
-                return umask
-            elif subgrid == "v":
-                vmask = tmask * tmask.take(
-                    range(1, tmask.shape[1] + 1), axis=1, mode="clip"
-                )
-                return vmask
-
-
-class OrcaTGrid:
-    def __init__(self, domain_cfg, masks=None):
-        ogrid = OrcaGrid(domain_cfg=domain_cfg, masks=masks)
-        self.name = ogrid.name
-        self.shape = ogrid.shape
-        self.size = ogrid.size
-        self.center_latitudes = ogrid.read_center_latitudes(subgrid="t")
-        self.center_longitudes = ogrid.read_center_longitudes(subgrid="t")
-        self.corner_latitudes = ogrid.read_corner_latitudes(subgrid="t")
-        self.corner_longitudes = ogrid.read_corner_longitudes(subgrid="t")
-        self.areas = ogrid.read_areas(subgrid="t")
-        self.mask = ogrid.read_mask(subgrid="t")
-
-
-class OrcaUGrid:
-    def __init__(self, domain_cfg, masks=None):
-        ogrid = OrcaGrid(domain_cfg=domain_cfg, masks=masks)
-        self.name = ogrid.name
-        self.shape = ogrid.shape
-        self.size = ogrid.size
-        self.center_latitudes = ogrid.read_center_latitudes(subgrid="u")
-        self.center_longitudes = ogrid.read_center_longitudes(subgrid="u")
-        self.corner_latitudes = ogrid.read_corner_latitudes(subgrid="u")
-        self.corner_longitudes = ogrid.read_corner_longitudes(subgrid="u")
-        self.areas = ogrid.read_areas(subgrid="u")
-        self.mask = ogrid.read_mask(subgrid="u")
-
-
-class OrcaVGrid:
-    def __init__(self, domain_cfg, masks=None):
-        ogrid = OrcaGrid(domain_cfg=domain_cfg, masks=masks)
-        self.name = ogrid.name
-        self.shape = ogrid.shape
-        self.size = ogrid.size
-        self.center_latitudes = ogrid.read_center_latitudes(subgrid="v")
-        self.center_longitudes = ogrid.read_center_longitudes(subgrid="v")
-        self.corner_latitudes = ogrid.read_corner_latitudes(subgrid="v")
-        self.corner_longitudes = ogrid.read_corner_longitudes(subgrid="v")
-        self.areas = ogrid.read_areas(subgrid="v")
-        self.mask = ogrid.read_mask(subgrid="v")
+            maskutil = self._read(f"{subgrid}maskutil", self._nc_masks)
+            return (~(maskutil > 0)).astype(np.uint8)
+
+        # Without a NEMO mask file, derive U and V masks from the T mask
+        tmask = self._tmask
+        if subgrid == "t":
+            return tmask
+        elif subgrid == "u":
+            umask = tmask * np.roll(tmask, -1, axis=0)
+            return umask
+        elif subgrid == "v":
+            vmask = tmask * np.concatenate((tmask[:, 1:], tmask[:, -1:]), axis=1)
+            return vmask
+
+
+# Shared OrcaGrids, keyed by the canonical paths of their files, see
+# _get_orca_grid() and close_orca_grids()
+_orca_grids = {}
+
+
+def _get_orca_grid(domain_cfg, masks=None, **kwargs):
+    """Returns a shared OrcaGrid, so that building the T, U, and V grids from the
+    same files reads each variable only once. The files are identified by their
+    canonical paths, so that a relative path still refers to the same file after
+    a change of the working directory. If the shared OrcaGrid has been closed, a
+    new one is created in its place."""
+    domain_cfg, masks = _realpath(domain_cfg), _realpath(masks)
+    key = (domain_cfg, masks, tuple(sorted(kwargs.items())))
+    ogrid = _orca_grids.get(key)
+    if ogrid is None or ogrid.closed:
+        ogrid = _orca_grids[key] = OrcaGrid(
+            domain_cfg=domain_cfg, masks=masks, **kwargs
+        )
+    return ogrid
+
+
+def close_orca_grids():
+    """Closes the files of all shared OrcaGrids and drops the stored variables.
+    Should be called once all ORCA grids are built (or if the files might have
+    changed on disk), grids built afterwards read the files again."""
+    for ogrid in _orca_grids.values():
+        ogrid.close()
+    _orca_grids.clear()
+
+
+class _OrcaSubgrid:
+    """Base class for the ORCA T, U, and V grids. The grid attributes are read
+    from the shared OrcaGrid on first access, not when the grid is created.
+    Hence, errors reading the variables from file (other than missing files,
+    dimensions or variables, which are checked up front) only surface when
+    the attributes are used, e.g. in CoupleGrid.write(). Further keyword
+    arguments (chunk_cache_size, backend, in_memory) are passed on to OrcaGrid"""
+
+    subgrid = None
+
+    def __init__(self, domain_cfg, masks=None, *, dtype=None, **kwargs):
+        # The file paths are resolved once, so that the grid keeps referring to
+        # the same files if the working directory changes later
+        self._ogrid_args = (_realpath(domain_cfg), _realpath(masks))
+        self._ogrid_kwargs = kwargs
+        self._dtype = dtype
+        self.name = self._ogrid.name
+        self.shape = self._ogrid.shape
+        self.size = self._ogrid.size
+
+    @property
+    def _ogrid(self):
+        # Looked up on every access, in case the shared OrcaGrid was closed
+        return _get_orca_grid(*self._ogrid_args, **self._ogrid_kwargs)
+
+    @cached_property
+    def center_latitudes(self):
+        return self._ogrid.read_center_latitudes(self.subgrid, dtype=self._dtype)
+
+    @cached_property
+    def center_longitudes(self):
+        return self._ogrid.read_center_longitudes(self.subgrid, dtype=self._dtype)
+
+    @cached_property
+    def corner_latitudes(self):
+        return self._ogrid.read_corner_latitudes(self.subgrid, dtype=self._dtype)
+
+    @cached_property
+    def corner_longitudes(self):
+        return self._ogrid.read_corner_longitudes(self.subgrid, dtype=self._dtype)
+
+    @cached_property
+    def areas(self):
+        return self._ogrid.read_areas(self.subgrid)
+
+    @cached_property
+    def mask(self):
+        return self._ogrid.read_mask(self.subgrid)
+
+
+class OrcaTGrid(_OrcaSubgrid):
+    subgrid = "t"
+
+
+class OrcaUGrid(_OrcaSubgrid):
+    subgrid = "u"
+
+
+class OrcaVGrid(_OrcaSubgrid):
+    subgrid = "v"
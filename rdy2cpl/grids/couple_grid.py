@@ -86,24 +86,23 @@ def from_model_spec(name, model_spec_file=_default_model_spec_file):
         )
         raise e from None
 
+    type_spec = couple_grid_spec["type"]
     try:
-        base_grid_type = _base_grids[couple_grid_spec["type"]["name"]]
+        base_grid_type = _base_grids[type_spec["name"]]
     except KeyError as e:
-        _log.error(
-            f"Unknown base grid name '{couple_grid_spec['type']['name']}' in model_spec"
-        )
+        _log.error(f"Unknown base grid name '{type_spec['name']}' in model_spec")
         raise e from None
 
     base_grid = base_grid_type(
-        *couple_grid_spec["type"].get("args", ()),
-        **couple_grid_spec["type"].get("kwargs", {}),
+        *type_spec.get("args", ()),
+        **type_spec.get("kwargs", {}),
     )
 
     for mm in couple_grid_spec.get("mask_modifiers", []):
         try:
             mm_func = _mask_modifiers[mm["name"]]
         except KeyError as e:
-            _log.error("Unknown mask modifier function {mm['name']}")
+            _log.error(f"Unknown mask modifier function {mm['name']}")
             raise e from None
         mm_func(base_grid, *mm.get("args", ()), **mm.get("kwargs", {}))
 